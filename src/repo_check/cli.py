@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import argparse
-import asyncio
+import functools
+import operator
 import os
+import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from typing import Iterable, List, Optional, Tuple
 
@@ -46,21 +49,37 @@ LABEL_IN_SYNC = "in-sync"
 LABEL_NO_UPSTREAM = "no-upstream"
 LABEL_ERROR = "error"
 
+# Matches `[section]` and `[section "subsection"]` headers in a git config file.
+_CONFIG_SECTION_RE = re.compile(
+    r'\[\s*([A-Za-z0-9.-]+)(?:\s+"((?:[^"\\]|\\.)*)")?\s*\]'
+)
 
+
+@functools.lru_cache(maxsize=256)
 def _color(text: str, code: str, use_color: bool) -> str:
     if not use_color:
         return text
     return f"{code}{text}{ANSI_RESET}"
 
 
-def _run_git(path: str, args: List[str]) -> Tuple[int, str, str]:
-    completed = subprocess.run(
-        ["git", "-C", path, *args],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        check=False,
-    )
+class GitNotFoundError(RuntimeError):
+    """Raised when the git executable cannot be found on PATH."""
+
+
+def _run_git(path: str, args: List[str]) -> Tuple[int, bytes, bytes]:
+    """Run git in path and return its exit code with stripped raw output.
+
+    Output stays as bytes; callers decode only the streams they display or parse.
+    """
+    try:
+        completed = subprocess.run(
+            ["git", "-C", path, *args],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            check=False,
+        )
+    except FileNotFoundError:
+        raise GitNotFoundError("git is not available on PATH") from None
     return completed.returncode, completed.stdout.strip(), completed.stderr.strip()
 
 
@@ -101,20 +120,26 @@ def _parse_bool(value: str) -> Optional[bool]:
     return None
 
 
-def _load_config(path: str) -> List[Tuple[str, str]]:
-    values: List[Tuple[str, str]] = []
+def _read_entries(path: str) -> List[str]:
+    """Return stripped, non-empty, non-comment lines of path ([] if missing)."""
     try:
         with open(path, "r", encoding="utf-8") as handle:
-            for line in handle:
-                stripped = line.strip()
-                if not stripped or stripped.startswith("#"):
-                    continue
-                if "=" not in stripped:
-                    continue
-                key, value = stripped.split("=", 1)
-                values.append((key.strip(), value.strip()))
+            data = handle.read()
     except FileNotFoundError:
         return []
+    return [
+        stripped
+        for stripped in (line.strip() for line in data.splitlines())
+        if stripped and not stripped.startswith("#")
+    ]
+
+
+def _load_config(path: str) -> List[Tuple[str, str]]:
+    values: List[Tuple[str, str]] = []
+    for entry in _read_entries(path):
+        key, sep, value = entry.partition("=")
+        if sep:
+            values.append((key.strip(), value.strip()))
     return values
 
 
@@ -147,21 +172,56 @@ def _coerce_config(values: List[Tuple[str, str]], defaults: dict) -> dict:
 
 def _load_ignore_entries() -> List[str]:
     """Load ignore entries from the ignore file."""
-    ignore_path = _ignore_file_path()
-    ignored: List[str] = []
-    try:
-        with open(ignore_path, "r", encoding="utf-8") as handle:
-            for line in handle:
-                stripped = line.strip()
-                if not stripped or stripped.startswith("#"):
-                    continue
-                ignored.append(stripped)
-    except FileNotFoundError:
-        return []
-    return ignored
+    return _read_entries(_ignore_file_path())
+
 
+def _with_sep(path: str) -> str:
+    """Return path with exactly one trailing separator for prefix matching."""
+    return path.rstrip(os.sep) + os.sep
 
-def _resolve_ignore_paths(base_path: str, entries: List[str]) -> List[str]:
+
+def _partition_ignore_entries(
+    entries: List[str],
+) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Split ignore entries into absolute and base-relative entries."""
+    absolute: List[str] = []
+    relative: List[str] = []
+    for entry in entries:
+        if os.path.isabs(os.path.expanduser(entry)):
+            absolute.append(entry)
+        else:
+            relative.append(entry)
+    return tuple(absolute), tuple(relative)
+
+
+def _partition_name_entries(
+    entries: Tuple[str, ...],
+) -> Tuple[frozenset[str], Tuple[str, ...]]:
+    """Split relative entries into bare child names and entries needing paths.
+
+    A bare name such as `node_modules` only ever matches the child of the base
+    with that name, so it can be checked without resolving a path.
+    """
+    names: set[str] = set()
+    paths: List[str] = []
+    for entry in entries:
+        bare = entry.rstrip("/" + os.sep)
+        if (
+            bare
+            and os.sep not in bare
+            and (os.altsep is None or os.altsep not in bare)
+            and bare not in {".", ".."}
+            and not bare.startswith("~")
+        ):
+            names.add(bare)
+        else:
+            paths.append(entry)
+    return frozenset(names), tuple(paths)
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_ignore_paths(base_path: str, entries: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Resolve ignore entries to absolute paths ending in a separator."""
     ignored: List[str] = []
     for entry in entries:
         expanded = os.path.expanduser(entry)
@@ -171,22 +231,13 @@ def _resolve_ignore_paths(base_path: str, entries: List[str]) -> List[str]:
             abs_path = os.path.abspath(
                 os.path.normpath(os.path.join(base_path, expanded))
             )
-        ignored.append(abs_path)
-    return ignored
+        ignored.append(_with_sep(abs_path))
+    return tuple(ignored)
 
 
-def _is_ignored(path: str, ignored_paths: List[str]) -> bool:
+def _is_ignored(path: str, ignored_paths: Tuple[str, ...]) -> bool:
     """Return True when path is the same as or under any ignored path."""
-    if not ignored_paths:
-        return False
-    for ignored in ignored_paths:
-        try:
-            common = os.path.commonpath([path, ignored])
-        except ValueError:
-            continue
-        if common == ignored:
-            return True
-    return False
+    return _with_sep(path).startswith(ignored_paths)
 
 
 def _ensure_config() -> dict:
@@ -203,102 +254,222 @@ def _ensure_config() -> dict:
     return _coerce_config(raw, defaults)
 
 
-def _check_repo(path: str, name: str) -> RepoResult:
-    code, _, _ = _run_git(path, ["rev-parse", "--is-inside-work-tree"])
-    if code != 0:
-        return RepoResult(
-            name=name,
-            path=path,
-            is_repo=False,
-            branch=None,
-            is_clean=None,
-            origin_url=None,
-            upstream_ref=None,
-            ahead_count=None,
-            behind_count=None,
-            error=None,
-        )
+@dataclass(frozen=True)
+class StatusSummary:
+    branch: Optional[str]
+    upstream_ref: Optional[str]
+    ahead_count: Optional[int]
+    behind_count: Optional[int]
+    is_clean: bool
+
+
+def _parse_status_v2(output: str) -> StatusSummary:
+    """Parse `git status --porcelain=v2 --branch` output.
 
-    code, branch, err = _run_git(path, ["rev-parse", "--abbrev-ref", "HEAD"])
+    Branch, upstream, and ahead/behind come from the `# branch.*` headers; any
+    other line is a changed or untracked entry and marks the tree dirty.
+    """
+    branch: Optional[str] = None
+    upstream_ref: Optional[str] = None
+    ahead_count: Optional[int] = None
+    behind_count: Optional[int] = None
     unborn_head = False
+    is_clean = True
+    for line in output.splitlines():
+        if not line.startswith("# "):
+            if line:
+                is_clean = False
+            continue
+        if line.startswith("# branch.oid "):
+            unborn_head = line[13:] == "(initial)"
+        elif line.startswith("# branch.head "):
+            head = line[14:]
+            branch = "HEAD" if head == "(detached)" else head
+        elif line.startswith("# branch.upstream "):
+            upstream_ref = line[18:]
+        elif line.startswith("# branch.ab "):
+            parts = line[12:].split()
+            if (
+                len(parts) == 2
+                and parts[0][:1] == "+"
+                and parts[1][:1] == "-"
+                and parts[0][1:].isdigit()
+                and parts[1][1:].isdigit()
+            ):
+                ahead_count = int(parts[0][1:])
+                behind_count = int(parts[1][1:])
+
+    if unborn_head:
+        branch = LABEL_NO_COMMITS
+    if unborn_head or ahead_count is None:
+        # Without commits, or when the upstream ref is gone, there is nothing
+        # to compare against.
+        upstream_ref = None
+        ahead_count = None
+        behind_count = None
+    return StatusSummary(
+        branch=branch,
+        upstream_ref=upstream_ref,
+        ahead_count=ahead_count,
+        behind_count=behind_count,
+        is_clean=is_clean,
+    )
+
+
+def _read_origin_url(git_dir: str) -> Optional[str]:
+    """Return the first remote.origin.url from git_dir/config, if any.
+
+    Raises OSError when the file cannot be read and ValueError when it uses
+    syntax this reader does not follow (such as include directives).
+    """
+    config_path = os.path.join(git_dir, "config")
+    in_origin = False
+    with open(config_path, "r", encoding="utf-8", errors="replace") as handle:
+        for line in handle:
+            stripped = line.strip()
+            if not stripped or stripped[0] in "#;":
+                continue
+            if stripped.startswith("["):
+                match = _CONFIG_SECTION_RE.match(stripped)
+                rest = stripped[match.end() :].lstrip() if match else ""
+                if not match or (rest and rest[0] not in "#;"):
+                    # Covers headers with an inline `key = value` after them.
+                    raise ValueError(f"Unsupported config section: {stripped}")
+                section = match.group(1).lower()
+                if section in {"include", "includeif"}:
+                    raise ValueError("Config uses include directives")
+                in_origin = section == "remote.origin" or (
+                    section == "remote" and match.group(2) == "origin"
+                )
+                continue
+            if not in_origin:
+                continue
+            key, sep, value = stripped.partition("=")
+            if sep and key.strip().lower() == "url":
+                value = value.strip()
+                if len(value) >= 2 and value[0] == value[-1] == '"':
+                    value = value[1:-1]
+                return value or None
+    return None
+
+
+def _read_ref(git_dir: str, refname: str) -> Optional[str]:
+    """Return the object name refname points to, or None if it cannot be read."""
+    try:
+        with open(os.path.join(git_dir, refname), "rb") as handle:
+            value = handle.read().strip()
+        return value.decode("ascii", "replace") or None
+    except OSError:
+        pass
+    target = refname.encode("utf-8")
+    try:
+        with open(os.path.join(git_dir, "packed-refs"), "rb") as handle:
+            for line in handle:
+                oid, _, name = line.rstrip(b"\n").partition(b" ")
+                if name == target:
+                    return oid.decode("ascii", "replace")
+    except OSError:
+        pass
+    return None
+
+
+def _git_dir(path: str) -> Optional[str]:
+    """Return path/.git when it is a plain directory (not a gitdir pointer)."""
+    git_dir = os.path.join(path, ".git")
+    return git_dir if os.path.isdir(git_dir) else None
+
+
+def _origin_url(path: str) -> Optional[str]:
+    """Return the origin URL, reading .git/config directly when possible."""
+    git_dir = _git_dir(path)
+    if git_dir:
+        try:
+            return _read_origin_url(git_dir)
+        except (OSError, ValueError):
+            pass
+    code, origin, _ = _run_git(path, ["remote", "get-url", "origin"])
+    if code == 0 and origin:
+        return origin.decode("utf-8", "replace")
+    return None
+
+
+def _check_repo(path: str, name: str, show_remote: bool = True) -> RepoResult:
+    """Inspect one folder; remote lookups and fetches only run for show_remote."""
+    code, status, err = _run_git(path, ["status", "--porcelain=v2", "--branch"])
     if code != 0:
-        lowered = (err or "").lower()
-        if "unknown revision" in lowered or "ambiguous argument 'head'" in lowered:
-            unborn_head = True
-            branch = LABEL_NO_COMMITS
-        else:
+        # Only the failure path pays for this probe; its exit code, unlike
+        # git's translated stderr, reliably tells a plain folder from a repo.
+        probe_code, _, _ = _run_git(path, ["rev-parse", "--is-inside-work-tree"])
+        if probe_code != 0:
             return RepoResult(
                 name=name,
                 path=path,
-                is_repo=True,
+                is_repo=False,
                 branch=None,
                 is_clean=None,
                 origin_url=None,
                 upstream_ref=None,
                 ahead_count=None,
                 behind_count=None,
-                error=err or None,
+                error=None,
             )
-
-    code, status, err = _run_git(path, ["status", "--porcelain"])
-    if code != 0:
         return RepoResult(
             name=name,
             path=path,
             is_repo=True,
-            branch=branch,
+            branch=None,
             is_clean=None,
             origin_url=None,
             upstream_ref=None,
             ahead_count=None,
             behind_count=None,
-            error=err or None,
+            error=err.decode("utf-8", "replace") or None,
         )
 
-    code, origin, _ = _run_git(path, ["remote", "get-url", "origin"])
-    origin_url = origin if code == 0 and origin else None
-
-    if unborn_head:
-        upstream_ref = None
-        behind_count = None
-        ahead_count = None
-    else:
-        code, upstream, _ = _run_git(
-            path, ["rev-parse", "--abbrev-ref", "--symbolic-full-name", "@{u}"]
-        )
-        if code == 0 and upstream:
-            remote_name = _upstream_remote_name(upstream)
-            if remote_name:
-                _run_git(
-                    path, ["fetch", "--quiet", "--prune", "--no-tags", remote_name]
-                )
+    summary = _parse_status_v2(status.decode("utf-8", "replace"))
+    upstream_ref = summary.upstream_ref
+    ahead_count = summary.ahead_count
+    behind_count = summary.behind_count
+    origin_url: Optional[str] = None
+    if show_remote:
+        origin_url = _origin_url(path)
+
+    if show_remote and upstream_ref:
+        remote_name = _upstream_remote_name(upstream_ref)
+        git_dir = _git_dir(path)
+        tracking_ref = f"refs/remotes/{upstream_ref}"
+        before = _read_ref(git_dir, tracking_ref) if git_dir else None
+        moved = False
+        if remote_name:
+            code, _, _ = _run_git(
+                path, ["fetch", "--quiet", "--prune", "--no-tags", remote_name]
+            )
+            # Without a readable ref to compare, assume the fetch moved it.
+            moved = code == 0 and (
+                git_dir is None
+                or before is None
+                or _read_ref(git_dir, tracking_ref) != before
+            )
+        if moved:
+            # The fetch moved the upstream ref, so the counts reported by
+            # status are stale; recount against the refreshed ref.
             code, counts, _ = _run_git(
                 path, ["rev-list", "--left-right", "--count", "HEAD...@{u}"]
             )
-            if code == 0 and counts:
-                parts = counts.split()
-                if len(parts) == 2 and all(p.isdigit() for p in parts):
-                    ahead_count = int(parts[0])
-                    behind_count = int(parts[1])
-                else:
-                    behind_count = None
-                    ahead_count = None
+            parts = counts.split() if code == 0 else []
+            if len(parts) == 2 and all(p.isdigit() for p in parts):
+                ahead_count = int(parts[0])
+                behind_count = int(parts[1])
             else:
-                behind_count = None
                 ahead_count = None
-            upstream_ref = upstream
-        else:
-            upstream_ref = None
-            behind_count = None
-            ahead_count = None
+                behind_count = None
 
-    is_clean = status == ""
     return RepoResult(
         name=name,
         path=path,
         is_repo=True,
-        branch=branch,
-        is_clean=is_clean,
+        branch=summary.branch,
+        is_clean=summary.is_clean,
         origin_url=origin_url,
         upstream_ref=upstream_ref,
         ahead_count=ahead_count,
@@ -310,32 +481,40 @@ def _check_repo(path: str, name: str) -> RepoResult:
 def _list_subfolders(
     base_path: str,
     include_hidden: bool,
-    ignored_paths: List[str],
+    ignored_paths: Tuple[str, ...],
+    ignored_names: frozenset[str] = frozenset(),
 ) -> List[Tuple[str, str]]:
-    entries: List[Tuple[str, str]] = []
+    keyed: List[Tuple[str, str, str]] = []
 
     with os.scandir(base_path) as it:
         for entry in it:
+            # Cheapest checks first: name tests need no syscalls or path work.
+            if not include_hidden and entry.name.startswith("."):
+                continue
+            if entry.name in ignored_names:
+                continue
             if not entry.is_dir(follow_symlinks=False):
                 continue
             if _is_ignored(entry.path, ignored_paths):
                 continue
-            if not include_hidden and entry.name.startswith("."):
-                continue
-            rel_path = os.path.relpath(entry.path, base_path)
-            entries.append((rel_path, entry.path))
+            # Entries are immediate children, so the name is the relative path.
+            keyed.append((entry.name.lower(), entry.name, entry.path))
 
-    entries.sort(key=lambda item: item[0].lower())
-    return entries
+    keyed.sort(key=operator.itemgetter(0))
+    return [(name, path) for _, name, path in keyed]
 
 
 def _normalize_paths(paths: List[str]) -> List[str]:
     normalized: List[str] = []
     seen: set[str] = set()
+    resolved: dict[str, str] = {}
     for path in paths:
         if not path:
             continue
-        expanded = os.path.abspath(os.path.expanduser(path))
+        expanded = resolved.get(path)
+        if expanded is None:
+            expanded = os.path.abspath(os.path.expanduser(path))
+            resolved[path] = expanded
         if expanded in seen:
             continue
         seen.add(expanded)
@@ -344,16 +523,8 @@ def _normalize_paths(paths: List[str]) -> List[str]:
 
 
 def _has_ancestor(path: str, candidates: set[str]) -> bool:
-    for other in candidates:
-        if other == path:
-            continue
-        try:
-            common = os.path.commonpath([path, other])
-        except ValueError:
-            continue
-        if common == other:
-            return True
-    return False
+    others = tuple(_with_sep(other) for other in candidates if other != path)
+    return _with_sep(path).startswith(others)
 
 
 def _build_scan_list(
@@ -367,17 +538,42 @@ def _build_scan_list(
         path for path in target_paths if not _has_ancestor(path, target_set)
     ]
 
-    def add_for_base(base_path: str, prefix: str) -> None:
-        ignored_paths = _resolve_ignore_paths(base_path, ignore_entries)
-        entries = _list_subfolders(base_path, include_hidden, ignored_paths)
+    absolute_entries, relative_entries = _partition_ignore_entries(ignore_entries)
+    absolute_ignored = _resolve_ignore_paths(os.sep, absolute_entries)
+    ignored_names, relative_path_entries = _partition_name_entries(relative_entries)
+
+    def add_for_base(
+        base_path: str, prefix: str, out: List[Tuple[str, str]]
+    ) -> List[Tuple[str, str]]:
+        ignored_paths = absolute_ignored + _resolve_ignore_paths(
+            base_path, relative_path_entries
+        )
+        entries = _list_subfolders(
+            base_path, include_hidden, ignored_paths, ignored_names
+        )
         for name, path in entries:
             display = f"{prefix}{name}"
-            names_and_paths.append((display, path))
+            out.append((display, path))
             if path in target_set:
-                add_for_base(path, f"{prefix}└─ ")
-
-    for base_path in root_targets:
-        add_for_base(base_path, "")
+                add_for_base(path, f"{prefix}└─ ", out)
+        return out
+
+    if len(root_targets) <= 1:
+        for base_path in root_targets:
+            add_for_base(base_path, "", names_and_paths)
+        return names_and_paths
+
+    # Roots are independent, so overlap their directory I/O; each root still
+    # recurses serially and results are merged in root order.
+    with ThreadPoolExecutor(
+        max_workers=min(8, len(root_targets)), thread_name_prefix="repo-check-scan"
+    ) as executor:
+        futures = [
+            executor.submit(add_for_base, base_path, "", [])
+            for base_path in root_targets
+        ]
+        for future in futures:
+            names_and_paths.extend(future.result())
 
     return names_and_paths
 
@@ -389,193 +585,225 @@ def _find_ignored_targets(
     ignored_targets: List[str] = []
     seen: set[str] = set()
     target_set = set(target_paths)
+    absolute_entries, relative_entries = _partition_ignore_entries(ignore_entries)
+    absolute_ignored = _resolve_ignore_paths(os.sep, absolute_entries)
     for base_path in target_paths:
-        ignored_paths = _resolve_ignore_paths(base_path, ignore_entries)
+        ignored_paths = absolute_ignored + _resolve_ignore_paths(
+            base_path, relative_entries
+        )
         for target in target_set:
-            if target in ignored_paths and target not in seen:
+            if _with_sep(target) in ignored_paths and target not in seen:
                 seen.add(target)
                 ignored_targets.append(target)
     return ignored_targets
 
 
-def _render_lines(
-    names: List[str],
-    results: List[Optional[RepoResult]],
+_Cell = Tuple[str, str]
+
+_EMPTY_CELL: _Cell = ("", "")
+_MIN_BRANCH_WIDTH = max(len(LABEL_DETACHED), len(LABEL_UNKNOWN), len(LABEL_NO_COMMITS))
+_MIN_CLEAN_WIDTH = max(
+    len(LABEL_CLEAN),
+    len(LABEL_DIRTY),
+    len(LABEL_UNKNOWN),
+    len(LABEL_NOT_INIT),
+    len(LABEL_PENDING),
+)
+_MIN_REMOTE_WIDTH = max(len(LABEL_ORIGIN), len(LABEL_NO_REMOTE))
+_MIN_SYNC_WIDTH = max(len(LABEL_IN_SYNC), len(LABEL_NO_UPSTREAM), len(LABEL_ERROR))
+
+# Label and color for each branch sentinel; any other branch name is shown in blue.
+_BRANCH_MAP = {
+    "HEAD": (LABEL_DETACHED, ANSI_BLUE),
+    LABEL_NO_COMMITS: (LABEL_NO_COMMITS, ANSI_YELLOW),
+}
+_CLEAN_MAP = {
+    True: (LABEL_CLEAN, ANSI_GREEN),
+    False: (LABEL_DIRTY, ANSI_RED),
+    None: (LABEL_UNKNOWN, ANSI_YELLOW),
+}
+_REMOTE_MAP = {
+    True: (LABEL_ORIGIN, ANSI_CYAN),
+    False: (LABEL_NO_REMOTE, ANSI_RED),
+}
+_IN_SYNC_COLORED = {
+    True: _color(LABEL_IN_SYNC, ANSI_GREEN, True),
+    False: LABEL_IN_SYNC,
+}
+
+_format_row = "{}  {}  {}  {}  {}".format
+_format_row_no_remote = "{}  {}  {}".format
+
+
+def _format_cell(raw: str, colored: str, width: int) -> str:
+    # Pad to width visible characters; the ANSI codes in colored take no space.
+    return colored.ljust(width + len(colored) - len(raw))
+
+
+@functools.lru_cache(maxsize=4096)
+def _row_cells(
+    result: Optional[RepoResult],
     use_color: bool,
     show_remote: bool,
-) -> List[str]:
-    def format_cell(raw: str, colored: str, width: int) -> str:
-        pad = " " * max(0, width - len(raw))
-        return f"{colored}{pad}"
-
-    max_name = max(len(name) for name in names)
-    max_branch = max(len(LABEL_DETACHED), len(LABEL_UNKNOWN), len(LABEL_NO_COMMITS))
-    max_clean = max(
-        len(LABEL_CLEAN),
-        len(LABEL_DIRTY),
-        len(LABEL_UNKNOWN),
-        len(LABEL_NOT_INIT),
-        len(LABEL_PENDING),
-    )
-    max_remote = max(len(LABEL_ORIGIN), len(LABEL_NO_REMOTE))
-    max_sync = max(len(LABEL_IN_SYNC), len(LABEL_NO_UPSTREAM), len(LABEL_ERROR))
-
-    for result in results:
-        if not result or not result.is_repo:
-            continue
-        if result.branch:
-            max_branch = max(max_branch, len(result.branch))
-        if (
-            show_remote
-            and result.upstream_ref
-            and result.ahead_count is not None
-            and result.behind_count is not None
-        ):
+) -> Tuple[_Cell, ...]:
+    """Return the (raw, colored) cells following the name column of a row."""
+    if result is None or not result.is_repo:
+        if result is None:
+            branch_cell = (LABEL_PENDING, _color(LABEL_PENDING, ANSI_DIM, use_color))
+        else:
+            branch_cell = (
+                LABEL_NOT_INIT,
+                _color(LABEL_NOT_INIT, ANSI_YELLOW, use_color),
+            )
+        if show_remote:
+            return (branch_cell, _EMPTY_CELL, _EMPTY_CELL, _EMPTY_CELL)
+        return (branch_cell, _EMPTY_CELL)
+
+    branch = result.branch or LABEL_UNKNOWN
+    branch_raw, branch_code = _BRANCH_MAP.get(branch, (branch, ANSI_BLUE))
+    branch_colored = _color(branch_raw, branch_code, use_color)
+    clean_raw, clean_code = _CLEAN_MAP[result.is_clean]
+    clean_colored = _color(clean_raw, clean_code, use_color)
+
+    if not show_remote:
+        return ((branch_raw, branch_colored), (clean_raw, clean_colored))
+
+    remote_raw, remote_code = _REMOTE_MAP[bool(result.origin_url)]
+    remote_colored = _color(remote_raw, remote_code, use_color)
+
+    if result.error:
+        sync_raw = LABEL_ERROR
+        sync_colored = _color(sync_raw, ANSI_RED, use_color)
+    elif (
+        result.upstream_ref
+        and result.ahead_count is not None
+        and result.behind_count is not None
+    ):
+        if result.ahead_count == 0 and result.behind_count == 0:
+            sync_raw = LABEL_IN_SYNC
+            sync_colored = _IN_SYNC_COLORED[use_color]
+        else:
             parts: List[str] = []
             if result.ahead_count > 0:
                 parts.append(f"ahead {result.ahead_count}")
             if result.behind_count > 0:
                 parts.append(f"behind {result.behind_count}")
-            label = ", ".join(parts) if parts else LABEL_IN_SYNC
-            max_sync = max(max_sync, len(label))
+            sync_raw = ", ".join(parts) if parts else "out-of-sync"
+            color = ANSI_RED if result.behind_count > 0 else ANSI_YELLOW
+            sync_colored = _color(sync_raw, color, use_color)
+    else:
+        sync_raw = LABEL_NO_UPSTREAM
+        sync_colored = _color(sync_raw, ANSI_YELLOW, use_color)
+
+    return (
+        (branch_raw, branch_colored),
+        (clean_raw, clean_colored),
+        (remote_raw, remote_colored),
+        (sync_raw, sync_colored),
+    )
 
-    lines: List[str] = []
-    for idx, name in enumerate(names):
-        result = results[idx]
-        if result is None:
-            branch_raw = LABEL_PENDING
-            branch_colored = _color(branch_raw, ANSI_DIM, use_color)
-            if show_remote:
-                line = (
-                    f"{format_cell(name, name, max_name)}  "
-                    f"{format_cell(branch_raw, branch_colored, max_branch)}  "
-                    f"{format_cell('', '', max_clean)}  "
-                    f"{format_cell('', '', max_remote)}  "
-                    f"{format_cell('', '', max_sync)}"
-                )
-            else:
-                line = (
-                    f"{format_cell(name, name, max_name)}  "
-                    f"{format_cell(branch_raw, branch_colored, max_branch)}  "
-                    f"{format_cell('', '', max_clean)}"
-                )
-            lines.append(line)
-            continue
 
-        if not result.is_repo:
-            branch_raw = LABEL_NOT_INIT
-            branch_colored = _color(branch_raw, ANSI_YELLOW, use_color)
-            if show_remote:
-                line = (
-                    f"{format_cell(name, name, max_name)}  "
-                    f"{format_cell(branch_raw, branch_colored, max_branch)}  "
-                    f"{format_cell('', '', max_clean)}  "
-                    f"{format_cell('', '', max_remote)}  "
-                    f"{format_cell('', '', max_sync)}"
-                )
-            else:
-                line = (
-                    f"{format_cell(name, name, max_name)}  "
-                    f"{format_cell(branch_raw, branch_colored, max_branch)}  "
-                    f"{format_cell('', '', max_clean)}"
-                )
-            lines.append(line)
-            continue
+@functools.lru_cache(maxsize=4096)
+def _render_row(name: str, cells: Tuple[_Cell, ...], widths: Tuple[int, ...]) -> str:
+    formatter = _format_row if len(cells) == 4 else _format_row_no_remote
+    return formatter(
+        _format_cell(name, name, widths[0]),
+        *(
+            _format_cell(raw, colored, width)
+            for (raw, colored), width in zip(cells, widths[1:])
+        ),
+    )
 
-        branch = result.branch or LABEL_UNKNOWN
-        if branch == "HEAD":
-            branch_raw = LABEL_DETACHED
-            branch_colored = _color(branch_raw, ANSI_BLUE, use_color)
-        elif branch == LABEL_NO_COMMITS:
-            branch_raw = LABEL_NO_COMMITS
-            branch_colored = _color(branch_raw, ANSI_YELLOW, use_color)
-        else:
-            branch_raw = branch
-            branch_colored = _color(branch_raw, ANSI_BLUE, use_color)
-
-        if result.is_clean is True:
-            clean_raw = LABEL_CLEAN
-            clean_colored = _color(clean_raw, ANSI_GREEN, use_color)
-        elif result.is_clean is False:
-            clean_raw = LABEL_DIRTY
-            clean_colored = _color(clean_raw, ANSI_RED, use_color)
-        else:
-            clean_raw = LABEL_UNKNOWN
-            clean_colored = _color(clean_raw, ANSI_YELLOW, use_color)
 
-        remote_raw = ""
-        remote_colored = ""
-        sync_raw = ""
-        sync_colored = ""
-        if show_remote:
-            if result.origin_url:
-                remote_raw = LABEL_ORIGIN
-                remote_colored = _color(remote_raw, ANSI_CYAN, use_color)
-            else:
-                remote_raw = LABEL_NO_REMOTE
-                remote_colored = _color(remote_raw, ANSI_RED, use_color)
-            if (
-                result.upstream_ref
-                and result.ahead_count is not None
-                and result.behind_count is not None
-            ):
-                if result.behind_count == 0 and result.ahead_count == 0:
-                    sync_raw = LABEL_IN_SYNC
-                    sync_colored = _color(sync_raw, ANSI_GREEN, use_color)
-                else:
-                    parts = []
-                    if result.ahead_count > 0:
-                        parts.append(f"ahead {result.ahead_count}")
-                    if result.behind_count > 0:
-                        parts.append(f"behind {result.behind_count}")
-                    label = ", ".join(parts) if parts else "out-of-sync"
-                    color = ANSI_RED if result.behind_count > 0 else ANSI_YELLOW
-                    sync_raw = label
-                    sync_colored = _color(sync_raw, color, use_color)
-            else:
-                sync_raw = LABEL_NO_UPSTREAM
-                sync_colored = _color(sync_raw, ANSI_YELLOW, use_color)
+def _render_row_plain(
+    name: str, cells: Tuple[_Cell, ...], widths: Tuple[int, ...]
+) -> str:
+    """Render a row without color, padding raw text with str.ljust."""
+    formatter = _format_row if len(cells) == 4 else _format_row_no_remote
+    return formatter(
+        name.ljust(widths[0]),
+        *(raw.ljust(width) for (raw, _), width in zip(cells, widths[1:])),
+    )
 
-        if result.error:
-            sync_raw = LABEL_ERROR
-            sync_colored = _color(sync_raw, ANSI_RED, use_color)
 
+def _render_table(
+    names: List[str],
+    results: List[Optional[RepoResult]],
+    use_color: bool,
+    show_remote: bool,
+) -> Tuple[List[str], Tuple[int, ...]]:
+    """Render all rows and return them with the column widths used."""
+    max_name = 0
+    max_branch = _MIN_BRANCH_WIDTH
+    max_clean = _MIN_CLEAN_WIDTH
+    max_remote = _MIN_REMOTE_WIDTH
+    max_sync = _MIN_SYNC_WIDTH
+
+    rows: List[Tuple[str, Tuple[_Cell, ...]]] = []
+    for name, result in zip(names, results):
+        cells = _row_cells(result, use_color, show_remote)
+        rows.append((name, cells))
+        if len(name) > max_name:
+            max_name = len(name)
+        branch_len = len(cells[0][0])
+        if branch_len > max_branch:
+            max_branch = branch_len
         if show_remote:
-            line = (
-                f"{format_cell(name, name, max_name)}  "
-                f"{format_cell(branch_raw, branch_colored, max_branch)}  "
-                f"{format_cell(clean_raw, clean_colored, max_clean)}  "
-                f"{format_cell(remote_raw, remote_colored, max_remote)}  "
-                f"{format_cell(sync_raw, sync_colored, max_sync)}"
-            )
-        else:
-            line = (
-                f"{format_cell(name, name, max_name)}  "
-                f"{format_cell(branch_raw, branch_colored, max_branch)}  "
-                f"{format_cell(clean_raw, clean_colored, max_clean)}"
-            )
+            sync_len = len(cells[3][0])
+            if sync_len > max_sync:
+                max_sync = sync_len
+
+    if show_remote:
+        widths: Tuple[int, ...] = (
+            max_name,
+            max_branch,
+            max_clean,
+            max_remote,
+            max_sync,
+        )
+    else:
+        widths = (max_name, max_branch, max_clean)
+    # Plain output is rendered once, so it skips the colored-cell row cache.
+    render_row = _render_row if use_color else _render_row_plain
+    return [render_row(name, cells, widths) for name, cells in rows], widths
+
+
+def _render_lines(
+    names: List[str],
+    results: List[Optional[RepoResult]],
+    use_color: bool,
+    show_remote: bool,
+) -> List[str]:
+    return _render_table(names, results, use_color, show_remote)[0]
 
-        lines.append(line)
 
-    return lines
+def _fit_widths(widths: Tuple[int, ...], cells: Tuple[_Cell, ...]) -> Tuple[int, ...]:
+    """Return widths grown as needed to fit cells; the name column is fixed."""
+    return (widths[0],) + tuple(
+        max(width, len(raw)) for (raw, _), width in zip(cells, widths[1:])
+    )
 
 
 def _clear_lines(line_count: int) -> None:
     if line_count <= 0:
         return
-    sys.stdout.write(f"\x1b[{line_count}A")
-    for _ in range(line_count):
-        sys.stdout.write("\x1b[2K\r\n")
-    sys.stdout.write(f"\x1b[{line_count}A")
+    up = f"\x1b[{line_count}A"
+    sys.stdout.write(up + "\x1b[2K\r\n" * line_count + up)
+
+
+def _replace_line(lines_up: int, line: str) -> None:
+    """Rewrite the line lines_up rows above the cursor, then return to it."""
+    sys.stdout.write(f"\x1b[{lines_up}A\r\x1b[2K{line}\x1b[{lines_up}B\r")
+    sys.stdout.flush()
 
 
 def _print_block(lines: Iterable[str]) -> None:
-    for line in lines:
-        sys.stdout.write(line + "\n")
+    block = "".join(f"{line}\n" for line in lines)
+    sys.stdout.write(block)
     sys.stdout.flush()
 
 
-async def _run_checks(
+def _run_checks(
     names_and_paths: List[Tuple[str, str]],
     use_color: bool,
     allow_dynamic: bool,
@@ -585,24 +813,37 @@ async def _run_checks(
     names = [name for name, _ in names_and_paths]
     results: List[Optional[RepoResult]] = [None] * len(names)
 
-    loop = asyncio.get_running_loop()
-    semaphore = asyncio.Semaphore(max_workers)
-
-    async def run_one(idx: int, name: str, path: str) -> None:
-        async with semaphore:
-            result = await loop.run_in_executor(None, _check_repo, path, name)
-        results[idx] = result
-        if allow_dynamic:
-            _clear_lines(len(names))
-            _print_block(_render_lines(names, results, use_color, show_remote))
-
     if allow_dynamic:
-        _print_block(_render_lines(names, results, use_color, show_remote))
+        lines, widths = _render_table(names, results, use_color, show_remote)
+        _print_block(lines)
 
-    tasks = [
-        run_one(idx, name, path) for idx, (name, path) in enumerate(names_and_paths)
-    ]
-    await asyncio.gather(*tasks)
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="repo-check"
+    )
+    try:
+        futures = {
+            executor.submit(_check_repo, path, name, show_remote): idx
+            for idx, (name, path) in enumerate(names_and_paths)
+        }
+        for future in as_completed(futures):
+            idx = futures[future]
+            result = future.result()
+            results[idx] = result
+            if not allow_dynamic:
+                continue
+            cells = _row_cells(result, use_color, show_remote)
+            if _fit_widths(widths, cells) != widths:
+                # A wider cell shifts every column, so redraw the whole table.
+                _clear_lines(len(names))
+                lines, widths = _render_table(names, results, use_color, show_remote)
+                _print_block(lines)
+            else:
+                _replace_line(len(names) - idx, _render_row(names[idx], cells, widths))
+    except BaseException:
+        # Drop queued checks so an interrupt does not wait for the whole scan.
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    executor.shutdown()
 
     if not allow_dynamic:
         _print_block(_render_lines(names, results, use_color, show_remote))
@@ -640,11 +881,6 @@ def main() -> None:
     parser = build_parser(defaults)
     args = parser.parse_args()
 
-    git_code, _, _ = _run_git(os.getcwd(), ["--version"])
-    if git_code != 0:
-        print("Error: git is not available on PATH. Please install Git and try again.")
-        sys.exit(1)
-
     include_hidden = not args.exclude_hidden
     raw_paths = args.path if args.path else defaults["paths"]
     target_paths = _normalize_paths(raw_paths)
@@ -672,17 +908,18 @@ def main() -> None:
     allow_dynamic = use_color
 
     try:
-        asyncio.run(
-            _run_checks(
-                names_and_paths,
-                use_color,
-                allow_dynamic,
-                args.max_workers,
-                show_remote=True,
-            )
+        _run_checks(
+            names_and_paths,
+            use_color,
+            allow_dynamic,
+            args.max_workers,
+            show_remote=True,
         )
     except KeyboardInterrupt:
         print("\nInterrupted.")
+    except GitNotFoundError:
+        print("Error: git is not available on PATH. Please install Git and try again.")
+        sys.exit(1)
 
 
 if __name__ == "__main__":
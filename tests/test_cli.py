@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
 import repo_check.cli as cli
 
 
@@ -55,15 +57,11 @@ def test_build_scan_list_nested_order(tmp_path: Path) -> None:
 
 
 def test_check_repo_unborn_head(monkeypatch) -> None:
-    def fake_run_git(path: str, args: list[str]) -> tuple[int, str, str]:
-        if args == ["rev-parse", "--is-inside-work-tree"]:
-            return 0, "true", ""
-        if args == ["rev-parse", "--abbrev-ref", "HEAD"]:
-            return 128, "", "fatal: ambiguous argument 'HEAD'"
-        if args == ["status", "--porcelain"]:
-            return 0, "", ""
+    def fake_run_git(path: str, args: list[str]) -> tuple[int, bytes, bytes]:
+        if args == ["status", "--porcelain=v2", "--branch"]:
+            return 0, b"# branch.oid (initial)\n# branch.head main", b""
         if args == ["remote", "get-url", "origin"]:
-            return 1, "", ""
+            return 1, b"", b""
         raise AssertionError(f"Unexpected git args: {args}")
 
     monkeypatch.setattr(cli, "_run_git", fake_run_git)
@@ -76,6 +74,46 @@ def test_check_repo_unborn_head(monkeypatch) -> None:
     assert result.is_clean is True
 
 
+def test_check_repo_not_a_repo_with_translated_error(monkeypatch) -> None:
+    def fake_run_git(path: str, args: list[str]) -> tuple[int, bytes, bytes]:
+        if args == ["status", "--porcelain=v2", "--branch"]:
+            return 128, b"", "Schwerwiegend: Kein Git-Repository".encode()
+        if args == ["rev-parse", "--is-inside-work-tree"]:
+            return 128, b"", "Schwerwiegend: Kein Git-Repository".encode()
+        raise AssertionError(f"Unexpected git args: {args}")
+
+    monkeypatch.setattr(cli, "_run_git", fake_run_git)
+    result = cli._check_repo("/tmp/repo", "repo")
+
+    assert result.is_repo is False
+    assert result.error is None
+
+
+def test_check_repo_status_failure_in_repo_is_error(monkeypatch) -> None:
+    def fake_run_git(path: str, args: list[str]) -> tuple[int, bytes, bytes]:
+        if args == ["status", "--porcelain=v2", "--branch"]:
+            return 128, b"", b"fatal: index file corrupt"
+        if args == ["rev-parse", "--is-inside-work-tree"]:
+            return 0, b"true", b""
+        raise AssertionError(f"Unexpected git args: {args}")
+
+    monkeypatch.setattr(cli, "_run_git", fake_run_git)
+    result = cli._check_repo("/tmp/repo", "repo")
+
+    assert result.is_repo is True
+    assert result.error == "fatal: index file corrupt"
+
+
+def test_parse_status_v2_detached_and_dirty() -> None:
+    summary = cli._parse_status_v2(
+        "# branch.oid 1234\n# branch.head (detached)\n? new.txt"
+    )
+
+    assert summary.branch == "HEAD"
+    assert summary.upstream_ref is None
+    assert summary.is_clean is False
+
+
 def test_find_ignored_targets_resolves_paths(tmp_path: Path) -> None:
     base = tmp_path / "root"
     base.mkdir()
@@ -88,3 +126,122 @@ def test_find_ignored_targets_resolves_paths(tmp_path: Path) -> None:
     ignored = cli._find_ignored_targets(targets, ignore_entries)
 
     assert ignored == [str(target)]
+
+
+def test_is_ignored_matches_path_boundaries() -> None:
+    ignored = cli._resolve_ignore_paths("/work", ("skip",))
+
+    assert cli._is_ignored("/work/skip", ignored)
+    assert cli._is_ignored("/work/skip/child", ignored)
+    assert not cli._is_ignored("/work/skipped", ignored)
+    assert cli._is_ignored("/work", cli._resolve_ignore_paths("/work", ("/",)))
+
+
+def test_origin_url_reads_git_config(tmp_path: Path, monkeypatch) -> None:
+    git_dir = tmp_path / ".git"
+    git_dir.mkdir()
+    (git_dir / "config").write_text(
+        "[core]\n"
+        "\tbare = false\n"
+        '[remote "upstream"]\n'
+        "\turl = git@example.com:other/repo.git\n"
+        '[remote "origin"]\n'
+        "\turl = git@example.com:org/repo.git\n"
+        "\tfetch = +refs/heads/*:refs/remotes/origin/*\n",
+        encoding="utf-8",
+    )
+
+    def fake_run_git(path: str, args: list[str]) -> tuple[int, bytes, bytes]:
+        raise AssertionError(f"Unexpected git args: {args}")
+
+    monkeypatch.setattr(cli, "_run_git", fake_run_git)
+
+    assert cli._origin_url(str(tmp_path)) == "git@example.com:org/repo.git"
+
+
+def test_build_scan_list_ignores_by_name_and_path(tmp_path: Path) -> None:
+    base = tmp_path / "root"
+    for name in ["keep", "node_modules", "vendor", "nested"]:
+        (base / name).mkdir(parents=True)
+    (base / "nested" / "deep").mkdir()
+
+    names_and_paths = cli._build_scan_list(
+        [str(base)],
+        include_hidden=True,
+        ignore_entries=["node_modules/", str(base / "vendor"), "nested/deep"],
+    )
+
+    assert [name for name, _ in names_and_paths] == ["keep", "nested"]
+
+
+def test_load_config_skips_comments_and_invalid_lines(tmp_path: Path) -> None:
+    config_path = tmp_path / "config"
+    config_path.write_text(
+        "# comment\n\npath = /one\nnot-a-pair\nmax_workers=8\n",
+        encoding="utf-8",
+    )
+
+    assert cli._load_config(str(config_path)) == [
+        ("path", "/one"),
+        ("max_workers", "8"),
+    ]
+    assert cli._load_config(str(tmp_path / "missing")) == []
+
+
+def test_run_git_raises_when_git_missing(monkeypatch) -> None:
+    def fake_run(*args, **kwargs):
+        raise FileNotFoundError(2, "No such file or directory", "git")
+
+    monkeypatch.setattr(cli.subprocess, "run", fake_run)
+
+    with pytest.raises(cli.GitNotFoundError):
+        cli._run_git("/tmp/repo", ["status"])
+
+
+def test_build_scan_list_multiple_roots_keep_order(tmp_path: Path) -> None:
+    roots = [tmp_path / "z", tmp_path / "a", tmp_path / "m"]
+    for root in roots:
+        (root / "x").mkdir(parents=True)
+        (root / "y").mkdir()
+
+    names_and_paths = cli._build_scan_list(
+        [str(root) for root in roots],
+        include_hidden=True,
+        ignore_entries=[],
+    )
+
+    assert [path for _, path in names_and_paths] == [
+        str(root / child) for root in roots for child in ("x", "y")
+    ]
+
+
+def test_origin_url_falls_back_for_inline_section_values(
+    tmp_path: Path, monkeypatch
+) -> None:
+    git_dir = tmp_path / ".git"
+    git_dir.mkdir()
+    (git_dir / "config").write_text(
+        '[remote "origin"] url = git@example.com:org/repo.git\n',
+        encoding="utf-8",
+    )
+    calls: list[list[str]] = []
+
+    def fake_run_git(path: str, args: list[str]) -> tuple[int, bytes, bytes]:
+        calls.append(args)
+        return 0, b"git@example.com:org/repo.git", b""
+
+    monkeypatch.setattr(cli, "_run_git", fake_run_git)
+
+    assert cli._origin_url(str(tmp_path)) == "git@example.com:org/repo.git"
+    assert calls == [["remote", "get-url", "origin"]]
+
+
+def test_origin_url_allows_comment_after_section(tmp_path: Path) -> None:
+    git_dir = tmp_path / ".git"
+    git_dir.mkdir()
+    (git_dir / "config").write_text(
+        '[remote "origin"] # main remote\n\turl = git@example.com:org/repo.git\n',
+        encoding="utf-8",
+    )
+
+    assert cli._read_origin_url(str(git_dir)) == "git@example.com:org/repo.git"
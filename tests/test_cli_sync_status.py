@@ -2,20 +2,33 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import List, Tuple
 
 from repo_check import cli
 
 
 GitCall = Tuple[str, ...]
-GitResult = Tuple[int, str, str]
+GitResult = Tuple[int, bytes, bytes]
+
+STATUS_CALL: GitCall = ("status", "--porcelain=v2", "--branch")
+STATUS_TRACKING = b"\n".join(
+    [
+        b"# branch.oid 1234",
+        b"# branch.head main",
+        b"# branch.upstream origin/main",
+        b"# branch.ab +0 -0",
+    ]
+)
 
 
-def _sequential_run_git(script: List[Tuple[GitCall, GitResult]]):
+def _sequential_run_git(
+    script: List[Tuple[GitCall, GitResult]], repo_path: str = "/tmp/repo"
+):
     calls: List[GitCall] = []
 
     def _fake_run_git(path: str, args: List[str]) -> GitResult:
-        assert path == "/tmp/repo"
+        assert path == repo_path
         call = tuple(args)
         calls.append(call)
         idx = len(calls) - 1
@@ -29,16 +42,10 @@ def _sequential_run_git(script: List[Tuple[GitCall, GitResult]]):
 
 def test_check_repo_fetches_upstream_and_maps_ahead_behind(monkeypatch):
     script = [
-        (("rev-parse", "--is-inside-work-tree"), (0, "true", "")),
-        (("rev-parse", "--abbrev-ref", "HEAD"), (0, "main", "")),
-        (("status", "--porcelain"), (0, "", "")),
-        (("remote", "get-url", "origin"), (0, "git@example.com:org/repo.git", "")),
-        (
-            ("rev-parse", "--abbrev-ref", "--symbolic-full-name", "@{u}"),
-            (0, "origin/main", ""),
-        ),
-        (("fetch", "--quiet", "--prune", "--no-tags", "origin"), (0, "", "")),
-        (("rev-list", "--left-right", "--count", "HEAD...@{u}"), (0, "3 1", "")),
+        (STATUS_CALL, (0, STATUS_TRACKING, b"")),
+        (("remote", "get-url", "origin"), (0, b"git@example.com:org/repo.git", b"")),
+        (("fetch", "--quiet", "--prune", "--no-tags", "origin"), (0, b"", b"")),
+        (("rev-list", "--left-right", "--count", "HEAD...@{u}"), (0, b"3 1", b"")),
     ]
     monkeypatch.setattr(cli, "_run_git", _sequential_run_git(script))
 
@@ -52,23 +59,22 @@ def test_check_repo_fetches_upstream_and_maps_ahead_behind(monkeypatch):
 
 def test_check_repo_continues_when_fetch_fails(monkeypatch):
     script = [
-        (("rev-parse", "--is-inside-work-tree"), (0, "true", "")),
-        (("rev-parse", "--abbrev-ref", "HEAD"), (0, "main", "")),
-        (("status", "--porcelain"), (0, "", "")),
-        (("remote", "get-url", "origin"), (0, "git@example.com:org/repo.git", "")),
         (
-            ("rev-parse", "--abbrev-ref", "--symbolic-full-name", "@{u}"),
-            (0, "origin/main", ""),
+            STATUS_CALL,
+            (0, STATUS_TRACKING.replace(b"+0 -0", b"+1 -2"), b""),
+        ),
+        (("remote", "get-url", "origin"), (0, b"git@example.com:org/repo.git", b"")),
+        (
+            ("fetch", "--quiet", "--prune", "--no-tags", "origin"),
+            (128, b"", b"offline"),
         ),
-        (("fetch", "--quiet", "--prune", "--no-tags", "origin"), (128, "", "offline")),
-        (("rev-list", "--left-right", "--count", "HEAD...@{u}"), (0, "0 2", "")),
     ]
     monkeypatch.setattr(cli, "_run_git", _sequential_run_git(script))
 
     result = cli._check_repo("/tmp/repo", "repo")
 
     assert result.error is None
-    assert result.ahead_count == 0
+    assert result.ahead_count == 1
     assert result.behind_count == 2
 
 
@@ -76,3 +82,42 @@ def test_upstream_remote_name():
     assert cli._upstream_remote_name("origin/main") == "origin"
     assert cli._upstream_remote_name("upstream/feature/foo") == "upstream"
     assert cli._upstream_remote_name("main") is None
+
+
+def test_check_repo_skips_remote_calls_without_show_remote(monkeypatch):
+    script = [
+        (STATUS_CALL, (0, STATUS_TRACKING, b"")),
+    ]
+    monkeypatch.setattr(cli, "_run_git", _sequential_run_git(script))
+
+    result = cli._check_repo("/tmp/repo", "repo", show_remote=False)
+
+    assert result.origin_url is None
+    assert result.upstream_ref == "origin/main"
+    assert result.ahead_count == 0
+    assert result.behind_count == 0
+
+
+def test_check_repo_reuses_status_counts_when_fetch_is_noop(
+    tmp_path: Path, monkeypatch
+):
+    ref_dir = tmp_path / ".git" / "refs" / "remotes" / "origin"
+    ref_dir.mkdir(parents=True)
+    (ref_dir / "main").write_text("1234\n", encoding="utf-8")
+    (tmp_path / ".git" / "config").write_text(
+        '[remote "origin"]\n\turl = git@example.com:org/repo.git\n',
+        encoding="utf-8",
+    )
+    script = [
+        (STATUS_CALL, (0, STATUS_TRACKING.replace(b"+0 -0", b"+2 -0"), b"")),
+        (("fetch", "--quiet", "--prune", "--no-tags", "origin"), (0, b"", b"")),
+    ]
+    monkeypatch.setattr(
+        cli, "_run_git", _sequential_run_git(script, repo_path=str(tmp_path))
+    )
+
+    result = cli._check_repo(str(tmp_path), "repo")
+
+    assert result.origin_url == "git@example.com:org/repo.git"
+    assert result.ahead_count == 2
+    assert result.behind_count == 0